@@ -1,4 +1,5 @@
 import sys
+import importlib.util
 import subprocess
 import os
 import bpy
@@ -13,11 +14,40 @@ target_path = os.path.join(user_script_path, "modules")
 if not os.path.exists(target_path):
     os.makedirs(target_path)
 
-print(f"Installing Gemini SDK to: {target_path}")
+if target_path not in sys.path:
+    sys.path.append(target_path)
 
-try:
-    # Use the new 'google-genai' library for Gemini 3+ support
-    subprocess.run([python_exe, "-m", "pip", "install", "--upgrade", "google-genai", "--target", target_path], check=True)
-    print("SUCCESS: Gemini SDK installed. Please RESTART Blender.")
-except Exception as e:
-    print(f"ERROR: {e}")
\ No newline at end of file
+def _is_installed(name):
+    """True if the module can be imported (find_spec raises for a missing parent)."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+def _poll_install():
+    """Timer callback: reports the result once pip finishes."""
+    if proc.poll() is None:
+        return 0.5 # Check again in half a second
+    if proc.returncode == 0:
+        print("SUCCESS: Gemini SDK installed. Please RESTART Blender.")
+    else:
+        print(f"ERROR: pip exited with code {proc.returncode}")
+    return None
+
+if _is_installed("google.genai"):
+    # Skip the pip start-up entirely. sys.exit() would close Blender, so just fall through.
+    print(f"Gemini SDK already installed in: {target_path}")
+else:
+    print(f"Installing Gemini SDK to: {target_path}")
+    try:
+        # Use the new 'google-genai' library for Gemini 3+ support.
+        # Prebuilt wheels only, so pip never falls back to a slow source build.
+        # Run pip in the background so Blender keeps drawing while it installs;
+        # its progress output goes straight to the system console.
+        proc = subprocess.Popen(
+            [python_exe, "-m", "pip", "install", "--upgrade", "--only-binary=:all:",
+             "--target", target_path, "google-genai"]
+        )
+        bpy.app.timers.register(_poll_install, first_interval=0.5)
+    except Exception as e:
+        print(f"ERROR: {e}")
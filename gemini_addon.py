@@ -1,8 +1,28 @@
 import bpy
+import builtins
 import os
+import re
+import ast
+import io
+import asyncio
+import json
+import marshal
 import sys
+import hashlib
+import importlib.util
 import subprocess
 import site
+import time
+import queue
+import threading
+import functools
+import logging
+import logging.handlers
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google import genai
 
 # --- ADDON METADATA ---
 bl_info = {
@@ -17,80 +37,758 @@ bl_info = {
 
 # --- UTILS ---
 
-def get_dependencies_status():
-    """Checks if required packages are installed."""
-    try:
-        import google.genai
-        import dotenv
+# Fixed system instructions, sent apart from the prompt so Gemini can cache them server-side
+_SYSTEM_PREAMBLE = (
+    "You are a Blender Python expert. Output ONLY raw, valid Python code ready for "
+    "Blender's exec() function. Do not include markdown formatting or explanations."
+)
+_VOICE_PREAMBLE = (
+    "You are a Blender Python expert. The user has provided a voice command. "
+    "Output ONLY raw executable code. No markdown, no conversation."
+)
+
+# Markdown code fences Gemini sometimes wraps around generated scripts
+_FENCE_RE = re.compile(r"```(?:python)?\n?")
+
+def _strip_fences(text):
+    """Returns the code inside the outermost ``` fences, or the text itself."""
+    start = text.find("```")
+    end = text.rfind("```")
+    if start == -1:
+        return text.strip()
+    if end == start:
+        # Unterminated fence (e.g. a truncated response)
+        return _FENCE_RE.sub("", text).strip()
+    code = text[start + 3:end]
+    if code.startswith("python"):
+        code = code[6:]
+    return code.strip()
+
+class _FenceStripper:
+    """Drops ``` fences and the prose outside them from a streamed response, one delta at a time.
+
+    Until a fence opens the text is taken to be bare code and passes straight
+    through; if a fence turns up later, that text is dropped again.
+    """
+
+    def __init__(self):
+        self._state = 'outside' # 'outside' | 'tag' (just opened a fence) | 'inside'
+        self._in_fence = False  # True once any fence has been seen
+        self._pending = ""      # Tail that may still turn into a fence or language tag
+        self._parts = []        # Code so far
+
+    @property
+    def text(self):
+        """The code seen so far, for the live preview."""
+        return "".join(self._parts)
+
+    def feed(self, delta):
+        """Consumes one streamed delta."""
+        text = self._pending + delta
+        self._pending = ""
+        while text:
+            if self._state == 'tag':
+                if text.startswith("python\n"):
+                    text = text[7:]
+                elif "python\n".startswith(text):
+                    self._pending = text # Tag split across deltas
+                    break
+                elif text.startswith("python"):
+                    text = text[6:]
+                elif text.startswith("\n"):
+                    text = text[1:]
+                self._state = 'inside'
+                continue
+
+            idx = text.find("```")
+            if idx == -1:
+                # Hold back trailing backticks that could start a fence in the next delta
+                keep = len(text) - len(text.rstrip("`"))
+                self._emit(text[:len(text) - keep])
+                self._pending = text[len(text) - keep:]
+                break
+            self._emit(text[:idx])
+            text = text[idx + 3:]
+            if self._state == 'inside':
+                self._state = 'outside'
+            else:
+                if not self._in_fence:
+                    self._parts.clear() # What came before the first fence was prose
+                    self._in_fence = True
+                self._state = 'tag'
+
+    def close(self):
+        """Returns the complete code once the stream has ended."""
+        pending, self._pending = self._pending, ""
+        if not self._in_fence or self._state == 'inside':
+            self._parts.append(pending)
+        return self.text
+
+    def _emit(self, text):
+        if self._state == 'inside' or not self._in_fence:
+            self._parts.append(text)
+
+_genai = None
+
+def _get_genai():
+    """Returns the google.genai module, importing it on first use only."""
+    global _genai
+    if _genai is None:
+        from google import genai as _g
+        _genai = _g
+    return _genai
+
+_audio = None
+
+def _get_audio_modules():
+    """Returns (sounddevice, numpy, scipy.io.wavfile), importing them on first use only."""
+    global _audio
+    if _audio is None:
         import sounddevice
         import numpy
         import scipy.io.wavfile
+        _audio = (sounddevice, numpy, scipy.io.wavfile)
+    return _audio
+
+_CLIENT = None
+_CLIENT_KEY = None
+_READ_TIMEOUT_SECONDS = 120 # Longest silence between bytes; there is no overall deadline
+_KEEPALIVE_SECONDS = 300 # Keep the pooled HTTPS connection open between clicks
+
+def _get_client(api_key):
+    """Returns a shared genai.Client, rebuilding it only when the key changes."""
+    global _CLIENT, _CLIENT_KEY
+    if _CLIENT is None or _CLIENT_KEY != api_key:
+        import httpx # Installed with google-genai
+        genai = _get_genai()
+        if _CLIENT is not None:
+            _close_client(_CLIENT)
+        # Only the httpx transport gets a (read) timeout: HttpOptions.timeout would
+        # also cap the total request time, which long thinking runs exceed
+        transport_args = {
+            "limits": httpx.Limits(keepalive_expiry=_KEEPALIVE_SECONDS),
+            "timeout": httpx.Timeout(None, read=_READ_TIMEOUT_SECONDS),
+        }
+        _CLIENT = genai.Client(
+            api_key=api_key,
+            http_options=genai.types.HttpOptions(
+                client_args=transport_args,
+                async_client_args=transport_args,
+            ),
+        )
+        _CLIENT_KEY = api_key
+    return _CLIENT
+
+class _TruncatedError(RuntimeError):
+    """The response hit max_output_tokens; the connection itself was fine."""
+
+def _check_finish(candidates):
+    """Raises if the response was cut off by max_output_tokens (half a script must not run)."""
+    if not candidates:
+        return
+    if candidates[0].finish_reason == _get_genai().types.FinishReason.MAX_TOKENS:
+        raise _TruncatedError("Gemini hit the Max Tokens limit before finishing. Raise it and try again.")
+
+def _close_client(client):
+    """Closes the connection pools of a client that is being replaced."""
+    try:
+        client.close()
+        if _LOOP is not None:
+            # The async pool belongs to the background loop, so close it there
+            _submit(client.aio.aclose())
+    except Exception as e:
+        print(f"Gemini client close failed: {e}")
+
+def _reset_client():
+    """Closes and drops the shared client so the next request builds a fresh one."""
+    global _CLIENT, _CLIENT_KEY
+    if _CLIENT is not None:
+        _close_client(_CLIENT)
+    _CLIENT = None
+    _CLIENT_KEY = None
+
+# All network I/O runs on one asyncio loop in a daemon thread, so concurrent
+# requests share it cooperatively and the UI thread never waits on a socket.
+_LOOP = None
+
+def _start_loop():
+    """Returns the background event loop, starting it if needed."""
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        threading.Thread(target=_LOOP.run_forever, name="gemini-aio", daemon=True).start()
+    return _LOOP
+
+def _stop_loop():
+    global _LOOP
+    if _LOOP is not None:
+        _LOOP.call_soon_threadsafe(_LOOP.stop)
+        _LOOP = None
+
+def _submit(coro):
+    """Schedules `coro` on the background loop; returns a concurrent.futures.Future."""
+    return asyncio.run_coroutine_threadsafe(coro, _start_loop())
+
+# Requests currently streaming, keyed like the response cache. Identical clicks
+# share one API call: each gets its own queue, and late joiners are replayed
+# everything posted so far.
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+def _join_or_start(key, out, start):
+    """Feeds `out` from an identical in-flight request, or begins one with `start()`.
+
+    Returns (joined, shared): whether an existing request was joined, and a
+    dict common to all of its consumers (see _claim_cache_write).
+    """
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(key)
+        if entry is not None and not entry["future"].done():
+            for message in entry["messages"]:
+                out.put(message)
+            entry["queues"].append(out)
+            return True, entry["shared"]
+        # A finished future that never published (cancelled, loop stopped) is dead; replace it
+        entry = _INFLIGHT[key] = {
+            "messages": [], "queues": [out], "future": None, "shared": {"cache_written": False},
+        }
+        # The coroutine can't publish before we release the lock
+        entry["future"] = start()
+        return False, entry["shared"]
+
+def _claim_cache_write(shared):
+    """True only for the first consumer of a shared request to ask, so the cache is written once.
+
+    Whoever finishes first writes it, even if the consumer that started the request left early.
+    """
+    with _INFLIGHT_LOCK:
+        if shared["cache_written"]:
+            return False
+        shared["cache_written"] = True
         return True
-    except ImportError:
-        return False
+
+def _publish(key, message):
+    """Delivers one message to every consumer of the request; the last one closes it."""
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(key)
+        if entry is None:
+            return
+        entry["messages"].append(message)
+        for out in entry["queues"]:
+            out.put(message)
+        if message[0] in ('done', 'err'):
+            del _INFLIGHT[key]
+
+def _leave(key, out):
+    """Detaches `out`; cancels the request once nobody is waiting on it any more."""
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(key)
+        if entry is None:
+            return
+        if out in entry["queues"]:
+            entry["queues"].remove(out)
+        if not entry["queues"]:
+            del _INFLIGHT[key]
+            entry["future"].cancel()
+
+def _cancel_inflight():
+    """Cancels every in-flight request and releases whoever is waiting on one."""
+    with _INFLIGHT_LOCK:
+        entries = list(_INFLIGHT.values())
+        _INFLIGHT.clear()
+    for entry in entries:
+        entry["future"].cancel()
+        for out in entry["queues"]:
+            out.put(('err', RuntimeError("Gemini addon was disabled.")))
+
+_API_HOST = "generativelanguage.googleapis.com"
+
+async def _prewarm():
+    """Warms DNS and the network path to the API host before the first click.
+
+    Deliberately stdlib-only: importing google.genai or building the client
+    here would undo the lazy import and race the main thread's _get_client.
+    """
+    try:
+        await asyncio.get_running_loop().getaddrinfo(_API_HOST, 443)
+        _, writer = await asyncio.wait_for(asyncio.open_connection(_API_HOST, 443, ssl=True), 5)
+        writer.close()
+    except Exception as e:
+        print(f"Gemini prewarm skipped: {e}")
+
+_CODE_CACHE = OrderedDict()
+_CODE_CACHE_SIZE = 32
+
+def _compile_cached(raw_code):
+    """Compiles generated code, reusing the code object for repeated scripts.
+
+    Raises SyntaxError before anything runs if the code doesn't parse.
+    """
+    digest = hashlib.blake2b(raw_code.encode(), digest_size=16).digest()
+    code_obj = _CODE_CACHE.get(digest)
+    if code_obj is None:
+        # A per-script filename makes tracebacks point at something better than <string>
+        filename = f"<gemini:{digest.hex()[:8]}>"
+        tree = ast.parse(raw_code, filename)
+        code_obj = compile(tree, filename, "exec")
+        _CODE_CACHE[digest] = code_obj
+        if len(_CODE_CACHE) > _CODE_CACHE_SIZE:
+            _CODE_CACHE.popitem(last=False)
+    else:
+        _CODE_CACHE.move_to_end(digest)
+    return code_obj
+
+def _exec_generated(code_obj):
+    """Runs generated code in a fresh namespace, so its names never pile up in this module.
+
+    Must be called on the main thread (bpy is not thread-safe).
+    """
+    # __name__ is "__main__" so the usual `if __name__ == "__main__":` scripts still run
+    namespace = {"__builtins__": builtins, "__name__": "__main__", "bpy": bpy}
+    exec(code_obj, namespace)
+
+_DEPS_OK = None
+
+def get_dependencies_status():
+    """Checks if required packages are installed (cached after the first probe).
+
+    Only looks the modules up, so the first panel draw doesn't pay for
+    importing google.genai and its dependency tree.
+    """
+    global _DEPS_OK
+    if _DEPS_OK is None:
+        _DEPS_OK = not _missing_packages()
+    return _DEPS_OK
+
+@functools.cache
+def _user_modules():
+    """Blender's user scripts/modules folder (resolved once, after bpy is ready)."""
+    return os.path.join(bpy.utils.user_resource('SCRIPTS'), "modules")
+
+# Module to probe -> pip package that provides it
+_REQUIRED_PACKAGES = {
+    "google.genai": "google-genai",
+    "sounddevice": "sounddevice",
+    "numpy": "numpy",
+    "scipy": "scipy", # find_spec imports parent packages, so probe the top level only
+}
+
+def _missing_packages():
+    """Returns the pip names of required packages that can't be found."""
+    missing = []
+    for module, package in _REQUIRED_PACKAGES.items():
+        try:
+            found = importlib.util.find_spec(module) is not None
+        except ModuleNotFoundError: # Parent package is missing
+            found = False
+        if not found:
+            missing.append(package)
+    return missing
 
 def install_dependencies():
-    """Installs google-genai and python-dotenv to the user scripts modules."""
+    """Starts pip for the missing packages; returns the process, or None if nothing is missing."""
+    missing = _missing_packages()
+    if not missing:
+        return None
+
     python_exe = sys.executable
-    target = os.path.join(bpy.utils.user_resource('SCRIPTS'), "modules")
+    target = _user_modules()
     
     # Ensure target directory exists
     if not os.path.exists(target):
         os.makedirs(target)
 
-    # Install using pip
-    subprocess.check_call([python_exe, "-m", "pip", "install", "google-genai", "python-dotenv", "sounddevice", "numpy", "scipy", "--target", target])
+    # Install using pip, in the background so Blender keeps drawing.
+    # Output goes to the system console rather than an undrained pipe.
+    return subprocess.Popen([
+        python_exe, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check", "--prefer-binary",
+        *missing, "--target", target,
+    ])
 
-def setup_environment():
-    """Initializes paths and loads environment variables."""
-    # 1. Add custom modules folder to sys.path
-    user_modules = os.path.join(bpy.utils.user_resource('SCRIPTS'), "modules")
-    if user_modules not in sys.path:
-        sys.path.append(user_modules)
+def _refresh_dependencies():
+    """Makes freshly installed packages importable and re-probes them."""
+    global _DEPS_OK
+    importlib.invalidate_caches()
+    setup_environment()
+    _DEPS_OK = None # Re-probe on the next panel draw
+
+_ADDON_DIR = os.path.dirname(os.path.realpath(__file__))
+_ENV_PATH = os.path.join(_ADDON_DIR, ".env")
 
-    # 2. Add local 'src' directory
-    addon_dir = os.path.dirname(os.path.realpath(__file__))
-    src_path = os.path.join(addon_dir, "src")
-    if os.path.exists(src_path) and src_path not in sys.path:
-        sys.path.append(src_path)
+_ENV_LOADED = False
+_PATHS_ADDED = False
+_API_KEY = ""
+_ENV_MTIME = None
+_DOTENV = {} # Values parsed from .env; kept out of os.environ
 
-    # 3. Load .env
+def _env_mtime():
+    """Modification time of the .env file, or None if there isn't one."""
     try:
-        from dotenv import load_dotenv
-        env_path = os.path.join(addon_dir, ".env")
-        load_dotenv(env_path)
-    except ImportError:
-        pass # Dependencies might not be installed yet
+        return os.stat(_ENV_PATH).st_mtime
+    except OSError:
+        return None
+
+def setup_environment(reload=False):
+    """Initializes paths and loads environment variables (once per session)."""
+    global _ENV_LOADED, _PATHS_ADDED, _API_KEY, _ENV_MTIME, _DOTENV
+    if _ENV_LOADED and not reload:
+        return True
+
+    # Paths only ever need adding once, even when the .env is reloaded
+    if not _PATHS_ADDED:
+        # 1. Add custom modules folder to sys.path
+        paths = [_user_modules()]
+
+        # 2. Add local 'src' directory
+        src_path = os.path.join(_ADDON_DIR, "src")
+        if os.path.exists(src_path):
+            paths.append(src_path)
+
+        known = set(sys.path)
+        sys.path.extend(path for path in paths if path not in known)
+
+        _PATHS_ADDED = True
+
+    # 3. Read .env into a private dict rather than the process-wide os.environ
+    _ENV_MTIME = _env_mtime()
+    _DOTENV = _manual_env_parse(_ENV_PATH)
+
+    # 4. Snapshot the API key so operators don't re-read the environment.
+    # The real environment always wins over .env.
+    _API_KEY = os.environ.get("GEMINI_API_KEY") or _DOTENV.get("GEMINI_API_KEY", "")
+
+    _ENV_LOADED = True
+    return True
+
+def _resolve_api_key(settings):
+    """Returns the API key, re-reading .env only if it changed since last load."""
+    if _env_mtime() != _ENV_MTIME:
+        setup_environment(reload=True)
+    return _API_KEY or settings.api_key
+
+# KEY=VALUE lines; comments and blank lines never match
+_ENV_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
 
 def _manual_env_parse(env_path):
-    """Fallback: Manually parses .env file if dotenv fails."""
+    """Parses KEY=VALUE lines from a .env file (no python-dotenv needed)."""
     if not os.path.exists(env_path):
         return {}
-    env_vars = {}
     try:
         with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#') or '=' not in line:
-                    continue
-                key, value = line.split('=', 1)
-                env_vars[key.strip()] = value.strip().strip('"').strip("'")
+            text = f.read()
     except Exception as e:
         print(f"Manual env parse failed: {e}")
-    return env_vars
+        return {}
+    return {key: value.strip('"').strip("'") for key, value in _ENV_RE.findall(text)}
 
-# --- PROPERTIES ---
-class GEMINI_MCP_ChatLine(bpy.types.PropertyGroup):
-    role: bpy.props.EnumProperty(
-        items=[('user', "User", ""), ('ai', "AI", "")]
+# --- RESPONSE CACHE ---
+@functools.cache
+def _cache_dir():
+    """Folder holding cached Gemini responses (created on first use)."""
+    path = os.path.join(bpy.utils.user_resource('CONFIG'), "gemini_cache")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _cache_key(model, prompt, **options):
+    """Deterministic key for a (model, prompt) pair plus anything else that shapes the reply."""
+    payload = json.dumps({"m": model, "p": prompt, **options}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _read_fresh(path, ttl):
+    """Returns the text at `path` if it is younger than `ttl` seconds, else None."""
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _write_atomic(path, data):
+    """Writes `data` (str or bytes) to `path` via a temp file so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if isinstance(data, bytes):
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+def _write_code(base, code, code_obj):
+    """Writes the source to `base`.py and the marshalled code object to `base`.pyc."""
+    _write_atomic(base + ".py", code)
+    # marshal's format changes between Python versions, so tag it like a real .pyc
+    _write_atomic(base + ".pyc", importlib.util.MAGIC_NUMBER + marshal.dumps(code_obj))
+
+def _load_code(base):
+    """Returns the code object stored next to `base`.py, or None if it can't be used."""
+    try:
+        with open(base + ".pyc", 'rb') as f:
+            data = f.read()
+        if not data.startswith(importlib.util.MAGIC_NUMBER):
+            return None
+        return marshal.loads(data[len(importlib.util.MAGIC_NUMBER):])
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def _cache_get(key, ttl):
+    """Returns (code, code object or None) cached for `key`, or None if missing or stale."""
+    base = os.path.join(_cache_dir(), key)
+    code = _read_fresh(base + ".py", ttl)
+    if code is None:
+        return None
+    return code, _load_code(base)
+
+def _cache_put(key, code, code_obj):
+    """Stores `code` and its compiled form under `key`."""
+    try:
+        _write_code(os.path.join(_cache_dir(), key), code, code_obj)
+    except OSError as e:
+        print(f"Gemini cache write failed: {e}")
+
+def _cache_clear():
+    """Deletes every cached response; returns how many were removed."""
+    removed = 0
+    with _SEMANTIC_LOCK:
+        for root, _, files in os.walk(_cache_dir()):
+            for name in files:
+                try:
+                    os.remove(os.path.join(root, name))
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
+
+# Near-duplicate prompts are matched by embedding similarity. Each model gets
+# an embeddings.npy matrix whose row i belongs to codes/<i>.py.
+_EMBED_MODEL = "gemini-embedding-001"
+_EMBED_DIMS = 768 # Truncated from the 3072 default; plenty for short prompts, 4x smaller on disk
+_SEMANTIC_LOCK = threading.Lock()
+
+def _semantic_dir(model):
+    """Per-model semantic cache folder (callers have already resolved _cache_dir)."""
+    path = os.path.join(_cache_dir(), "semantic", model)
+    os.makedirs(os.path.join(path, "codes"), exist_ok=True)
+    return path
+
+async def _embed(api_key, texts):
+    """Returns unit-length float32 embeddings of `texts`, one row each."""
+    import numpy as np
+    result = await _get_client(api_key).aio.models.embed_content(
+        model=_EMBED_MODEL,
+        contents=texts,
+        config=_get_genai().types.EmbedContentConfig(output_dimensionality=_EMBED_DIMS),
     )
-    content: bpy.props.StringProperty()
+    # Truncated embeddings are not normalized by the API
+    matrix = np.array([e.values for e in result.embeddings], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+async def _embed_prompt(api_key, prompt):
+    """Returns the unit-length embedding of `prompt` as a float32 vector."""
+    return (await _embed(api_key, [prompt]))[0]
+
+def _semantic_lookup(model, vec, threshold, ttl):
+    """Returns (code, code object or None) for the most similar earlier prompt, or None."""
+    import numpy as np
+    folder = _semantic_dir(model)
+    with _SEMANTIC_LOCK:
+        try:
+            matrix = np.load(os.path.join(folder, "embeddings.npy"))
+        except (OSError, ValueError):
+            return None
+    if matrix.ndim != 2 or matrix.shape[1] != vec.shape[0]:
+        return None
+
+    sims = matrix @ vec
+    candidates = np.flatnonzero(sims >= threshold)
+    for index in candidates[np.argsort(-sims[candidates])]:
+        base = os.path.join(folder, "codes", str(index))
+        code = _read_fresh(base + ".py", ttl)
+        if code is not None:
+            return code, _load_code(base)
+    return None
+
+def _semantic_store(model, vec, code, code_obj):
+    """Adds a (prompt embedding, code) pair to the model's semantic cache."""
+    import numpy as np
+    folder = _semantic_dir(model)
+    emb_path = os.path.join(folder, "embeddings.npy")
+    with _SEMANTIC_LOCK:
+        try:
+            matrix = np.load(emb_path)
+        except (OSError, ValueError):
+            matrix = None
+        if matrix is None or matrix.ndim != 2 or matrix.shape[1] != vec.shape[0]:
+            matrix = np.empty((0, vec.shape[0]), dtype=np.float32)
+
+        index = len(matrix)
+        _write_code(os.path.join(folder, "codes", str(index)), code, code_obj)
+        tmp_path = f"{emb_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.vstack([matrix, vec[np.newaxis, :]]))
+        os.replace(tmp_path, emb_path)
+
+async def _semantic_store_async(model, vec, code, code_obj):
+    """Runs _semantic_store off the UI thread (it rewrites the whole embeddings.npy)."""
+    try:
+        await asyncio.to_thread(_semantic_store, model, vec, code, code_obj)
+    except OSError as e:
+        print(f"Gemini semantic cache write failed: {e}")
+
+# A small "skill pack" of common requests answered from local code templates.
+# Gemini only fills in the template parameters, which is a much smaller call.
+_TEMPLATES_PATH = os.path.join(_ADDON_DIR, "templates.json")
+_TEMPLATE_THRESHOLD = 0.95
+_TEMPLATE_TYPES = {"integer": int, "number": float, "string": str, "boolean": bool}
+_TEMPLATES = None # (templates, unit-length embedding matrix) once embedded
+
+@functools.cache
+def _load_templates():
+    """Returns (templates, raw bytes) from templates.json, or None if there is no usable file.
+
+    Read once per session; a single-file install simply has no skill pack.
+    """
+    try:
+        with open(_TEMPLATES_PATH, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Gemini templates unavailable: {e}")
+        return None
+    try:
+        templates = json.loads(raw)
+    except ValueError as e:
+        print(f"Gemini templates.json is invalid, templates disabled: {e}")
+        return None
+    return (templates, raw) if templates else None
+
+async def _template_index(api_key):
+    """Returns the templates and the embeddings of their canonical prompts."""
+    global _TEMPLATES
+    if _TEMPLATES is None:
+        import numpy as np
+        templates, raw = _load_templates()
+        # Only re-embed when the templates or the embedding model change
+        digest = hashlib.sha256(raw + f"{_EMBED_MODEL}/{_EMBED_DIMS}".encode()).hexdigest()[:16]
+        path = os.path.join(_cache_dir(), f"templates-{digest}.npy")
+        try:
+            matrix = np.load(path)
+        except (OSError, ValueError):
+            matrix = await _embed(api_key, [t["canonical_prompt"] for t in templates])
+            buf = io.BytesIO()
+            np.save(buf, matrix)
+            _write_atomic(path, buf.getvalue())
+        _TEMPLATES = (templates, matrix)
+    return _TEMPLATES
+
+def _template_params(schema, values):
+    """Template defaults overridden by the model's values, coerced to the schema types."""
+    params = {}
+    for name, spec in schema.items():
+        value = values.get(name, spec["default"])
+        try:
+            params[name] = _TEMPLATE_TYPES[spec["type"]](value)
+        except (TypeError, ValueError):
+            params[name] = spec["default"]
+    return params
+
+async def _from_template(api_key, model, vec, prompt):
+    """Returns code built from the closest template, or None if none fits the request."""
+    try:
+        templates, matrix = await _template_index(api_key)
+        sims = matrix @ vec
+        best = int(sims.argmax())
+        if sims[best] < _TEMPLATE_THRESHOLD:
+            return None
+
+        template = templates[best]
+        schema = template["param_schema"]
+        genai = _get_genai()
+        response = await _get_client(api_key).aio.models.generate_content(
+            model=model,
+            contents=(
+                f"Request: {prompt}\n"
+                f"Template: {template['canonical_prompt']}\n"
+                f"Parameters: {json.dumps(schema)}\n"
+                'Return a JSON object {"fits": bool, "params": {...}}. Set "fits" to false '
+                "if the request asks for anything these parameters cannot express."
+            ),
+            config=genai.types.GenerateContentConfig(response_mime_type="application/json"),
+        )
+        reply = json.loads(response.text)
+        # Declined or malformed: a plain template would silently drop part of the request
+        if not isinstance(reply, dict) or reply.get("fits") is not True:
+            return None
+        values = reply.get("params")
+        if not isinstance(values, dict):
+            return None
+        return template["code_template"].format(**_template_params(schema, values))
+    except Exception as e:
+        print(f"Gemini template lookup failed, generating instead: {e}")
+        return None
+
+# Recent (role, content) lines shown in the panel. Kept in Python rather than
+# a CollectionProperty, so it costs no RNA writes but is not saved in the .blend.
+_CHAT_HISTORY = deque(maxlen=20)
+
+# --- DEBUG LOG ---
+# Generated scripts go to memory and a rotating gemini.log rather than the
+# system console, which is slow to write to (especially on Windows).
+_LOG = deque(maxlen=20) # Recent generated scripts, newest last
+_LOGGER = logging.getLogger("gemini")
+_LOG_HANDLER = None
+
+def _start_log():
+    """Attaches a rotating gemini.log in Blender's config folder to the logger."""
+    global _LOG_HANDLER
+    if _LOG_HANDLER is not None:
+        return
+    config_dir = bpy.utils.user_resource('CONFIG')
+    try:
+        os.makedirs(config_dir, exist_ok=True)
+        _LOG_HANDLER = logging.handlers.RotatingFileHandler(
+            os.path.join(config_dir, "gemini.log"),
+            maxBytes=1 << 20, backupCount=3, encoding='utf-8', delay=True
+        )
+    except OSError as e:
+        print(f"Gemini log unavailable: {e}")
+        return
+    _LOG_HANDLER.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    _LOGGER.addHandler(_LOG_HANDLER)
+    _LOGGER.setLevel(logging.DEBUG)
+    _LOGGER.propagate = False
+
+def _stop_log():
+    global _LOG_HANDLER
+    if _LOG_HANDLER is not None:
+        _LOGGER.removeHandler(_LOG_HANDLER)
+        _LOG_HANDLER.close()
+        _LOG_HANDLER = None
+
+def _log_generation(code, echo=False):
+    """Records generated code; only prints it to the console when `echo` is set."""
+    _LOG.append(code)
+    _LOGGER.debug(code)
+    if echo:
+        print("\n--- GEMINI GENERATED CODE ---")
+        print(code)
+
+# --- PROPERTIES ---
+
+def _on_api_key_update(self, context):
+    _reset_client()
+    self.connection_status = 'NONE'
 
 class GEMINI_MCP_Settings(bpy.types.PropertyGroup):
     api_key: bpy.props.StringProperty(
         name="API Key",
         description="Google AI Studio Key (Leave blank if set in .env)",
-        subtype='PASSWORD'
+        subtype='PASSWORD',
+        update=_on_api_key_update
     )
     prompt_input: bpy.props.StringProperty(
         name="Prompt",
@@ -105,6 +803,20 @@ class GEMINI_MCP_Settings(bpy.types.PropertyGroup):
         ],
         default='gemini-3-flash-preview'
     )
+    max_tokens: bpy.props.IntProperty(
+        name="Max Tokens",
+        description="Upper bound on the response length. Gemini 3 counts its thinking tokens here too",
+        default=16384,
+        min=1024,
+        max=65536
+    )
+    temperature: bpy.props.FloatProperty(
+        name="Temperature",
+        description="0 gives repeatable output, which also makes cached responses reliable",
+        default=0.0,
+        min=0.0,
+        max=2.0
+    )
     connection_status: bpy.props.EnumProperty(
         items=[
             ('NONE', "Not Tested", ""),
@@ -117,23 +829,138 @@ class GEMINI_MCP_Settings(bpy.types.PropertyGroup):
         name="Is Recording",
         default=False
     )
-    chat_history: bpy.props.CollectionProperty(type=GEMINI_MCP_ChatLine)
+    use_templates: bpy.props.BoolProperty(
+        name="Use Templates",
+        description=(
+            "Answer common requests from local templates, asking Gemini only for the parameters. "
+            "Needs templates.json next to the addon; does nothing in a single-file install"
+        ),
+        default=False
+    )
+    use_cache: bpy.props.BoolProperty(
+        name="Use Cache",
+        description="Reuse code from an identical earlier prompt instead of calling Gemini again",
+        default=True
+    )
+    use_semantic_cache: bpy.props.BoolProperty(
+        name="Match Similar Prompts",
+        description=(
+            "Also reuse code from earlier prompts that are merely similar. "
+            "Can run code written for a different request (e.g. another color)"
+        ),
+        default=False
+    )
+    cache_ttl_hours: bpy.props.FloatProperty(
+        name="Cache Lifetime (h)",
+        description="How long a cached response stays valid",
+        default=24.0,
+        min=0.0
+    )
+    similarity_threshold: bpy.props.FloatProperty(
+        name="Similarity",
+        description="Minimum embedding similarity for a near-duplicate prompt to reuse cached code",
+        default=0.92,
+        min=0.5,
+        max=1.0
+    )
+    debug_logging: bpy.props.BoolProperty(
+        name="Print Generated Code",
+        description="Also print each generated script to the system console",
+        default=False
+    )
+    generated_code: bpy.props.StringProperty(
+        name="Generated Code",
+        description="Code received from Gemini so far"
+    )
 
 # --- OPERATORS ---
 
 class GEMINI_MCP_OT_InstallDeps(bpy.types.Operator):
     bl_idname = "gemini_mcp.install_deps"
     bl_label = "Install Dependencies"
-    bl_description = "Installs google-genai and python-dotenv"
+    bl_description = "Installs google-genai and the voice command packages"
+
+    _timer = None
+    _proc = None
 
     def execute(self, context):
         try:
-            install_dependencies()
-            setup_environment()
-            self.report({'INFO'}, "Dependencies installed successfully!")
+            self._proc = install_dependencies()
         except Exception as e:
             self.report({'ERROR'}, f"Installation failed: {str(e)}")
             return {'CANCELLED'}
+
+        if self._proc is None:
+            _refresh_dependencies()
+            self.report({'INFO'}, "Dependencies already installed.")
+            return {'FINISHED'}
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+
+        self.report({'INFO'}, "Installing dependencies...")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        # No cancel key: events pass through, so an Esc meant for a menu or a
+        # transform would otherwise kill pip halfway through writing --target
+        if event.type != 'TIMER' or self._proc.poll() is None:
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        if self._proc.returncode != 0:
+            # A failed pip run can leave partial packages behind; re-probe
+            _refresh_dependencies()
+            self.report(
+                {'ERROR'},
+                f"Installation failed: pip exited with code {self._proc.returncode}. "
+                f"You may need to clean up {_user_modules()} before retrying."
+            )
+            return {'CANCELLED'}
+
+        _refresh_dependencies()
+        if context.area:
+            context.area.tag_redraw()
+        self.report({'INFO'}, "Dependencies installed successfully!")
+        return {'FINISHED'}
+
+class GEMINI_MCP_OT_ReloadEnv(bpy.types.Operator):
+    bl_idname = "gemini_mcp.reload_env"
+    bl_label = "Reload .env"
+    bl_description = "Re-reads the .env file and refreshes the cached API key"
+
+    def execute(self, context):
+        setup_environment(reload=True)
+        self.report({'INFO'}, "Environment reloaded.")
+        return {'FINISHED'}
+
+class GEMINI_MCP_OT_ClearCache(bpy.types.Operator):
+    bl_idname = "gemini_mcp.clear_cache"
+    bl_label = "Clear Cache"
+    bl_description = "Deletes all cached Gemini responses"
+
+    def execute(self, context):
+        try:
+            removed = _cache_clear()
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not clear cache: {str(e)}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Cleared {removed} cached responses.")
+        return {'FINISHED'}
+
+class GEMINI_MCP_OT_CopyLastCode(bpy.types.Operator):
+    bl_idname = "gemini_mcp.copy_last_code"
+    bl_label = "Copy Last Generation"
+    bl_description = "Copies the most recently generated script to the clipboard"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_LOG)
+
+    def execute(self, context):
+        context.window_manager.clipboard = _LOG[-1]
+        self.report({'INFO'}, "Generated code copied to clipboard.")
         return {'FINISHED'}
 
 class GEMINI_MCP_OT_TestConnection(bpy.types.Operator):
@@ -141,31 +968,15 @@ class GEMINI_MCP_OT_TestConnection(bpy.types.Operator):
     bl_label = "Test Connection"
     
     def execute(self, context):
-        setup_environment()
         try:
-            from google import genai
-            from dotenv import load_dotenv
-            
             settings = context.scene.gemini_mcp
-            addon_dir = os.path.dirname(os.path.realpath(__file__))
-            env_path = os.path.join(addon_dir, ".env")
-            load_dotenv(env_path)
-            
-            api_key = os.getenv("GEMINI_API_KEY")
-            
-            # Fallback to manual parsing if load_dotenv fails
-            if not api_key:
-                env_vars = _manual_env_parse(env_path)
-                api_key = env_vars.get("GEMINI_API_KEY")
-            
-            # Finally check settings
-            api_key = api_key or settings.api_key
+            api_key = _resolve_api_key(settings)
             
             if not api_key:
                 self.report({'ERROR'}, "Missing API Key")
                 return {'CANCELLED'}
 
-            client = genai.Client(api_key=api_key)
+            client = _get_client(api_key)
             client.models.generate_content(model=settings.model_name, contents="ping")
             
             settings.connection_status = 'SUCCESS'
@@ -181,67 +992,303 @@ class GEMINI_MCP_OT_TestConnection(bpy.types.Operator):
 class GEMINI_MCP_OT_Execute(bpy.types.Operator):
     bl_idname = "gemini_mcp.execute"
     bl_label = "Generate & Run"
-    
-    def execute(self, context):
-        setup_environment()
+
+    _timer = None
+    _job = None
+    _queue = None
+    _ping = None
+    _started = 0.0
+
+    @staticmethod
+    async def _stream(api_key, model, prompt, config):
+        """Yields the Gemini response text as it arrives. Never touches bpy."""
+        client = _get_client(api_key)
+        stream = await client.aio.models.generate_content_stream(model=model, contents=prompt, config=config)
+        async for chunk in stream:
+            _check_finish(chunk.candidates)
+            if chunk.text:
+                yield chunk.text
+
+    @classmethod
+    async def _messages(cls, api_key, model, prompt, config, semantic, templates):
+        """Yields ('embedding' | 'cached' | 'template' | 'delta', value) for one request. Never touches bpy."""
+        if semantic is not None or templates:
+            try:
+                vec = await _embed_prompt(api_key, prompt)
+            except Exception as e:
+                print(f"Gemini embedding failed, skipping local lookups: {e}")
+                vec = None
+            if vec is not None:
+                yield ('embedding', vec)
+                # Templates go first: they re-fill parameters, where a similar
+                # cached prompt would replay the old values
+                if templates:
+                    code = await _from_template(api_key, model, vec, prompt)
+                    if code is not None:
+                        yield ('template', code)
+                        return
+                if semantic is not None:
+                    hit = await asyncio.to_thread(_semantic_lookup, model, vec, *semantic)
+                    if hit is not None:
+                        yield ('cached', hit)
+                        return
+        async for delta in cls._stream(api_key, model, prompt, config):
+            yield ('delta', delta)
+
+    @classmethod
+    async def _run(cls, key, *args):
+        """Coroutine run on the background loop: publishes messages to every waiting operator."""
         try:
-            from google import genai
-            from dotenv import load_dotenv
-            
+            async for message in cls._messages(*args):
+                _publish(key, message)
+            _publish(key, ('done', None))
+        except Exception as e:
+            _publish(key, ('err', e))
+
+    @staticmethod
+    def _absorb(job, kind, value):
+        """Records one worker message on the job."""
+        if kind == 'delta':
+            job["fences"].feed(value)
+            job["received"] += len(value)
+        elif kind == 'embedding':
+            job["embedding"] = value
+        elif kind == 'cached':
+            job["text"], job["code_obj"] = value
+            job["cached"] = True
+        elif kind == 'template':
+            job["text"] = value
+            job["template"] = True
+
+    @staticmethod
+    async def _ping_model(api_key, model):
+        """Lightweight connectivity check, run alongside the real request."""
+        await _get_client(api_key).aio.models.generate_content(model=model, contents="ping")
+
+    def _prepare(self, context):
+        """Validates settings and builds the job for the worker, or returns None."""
+        settings = context.scene.gemini_mcp
+        api_key = _resolve_api_key(settings)
+
+        if not api_key:
+            self.report({'ERROR'}, "Missing API Key")
+            return None
+
+        try:
+            genai = _get_genai()
+        except ImportError:
+            self.report({'ERROR'}, "Dependencies missing. Please install them first.")
+            return None
+
+        config = genai.types.GenerateContentConfig(
+            system_instruction=_SYSTEM_PREAMBLE,
+            temperature=settings.temperature,
+            max_output_tokens=settings.max_tokens,
+        )
+        semantic = None
+        job = {"prompt": settings.prompt_input, "model": settings.model_name,
+               "received": 0, "fences": _FenceStripper()}
+        job["key"] = _cache_key(
+            settings.model_name, settings.prompt_input, system=_SYSTEM_PREAMBLE,
+            temperature=settings.temperature, max_tokens=settings.max_tokens,
+        )
+        if settings.use_cache:
+            ttl = settings.cache_ttl_hours * 3600
+            if settings.use_semantic_cache:
+                semantic = (settings.similarity_threshold, ttl)
+                job["semantic"] = True
+            job["cache_key"] = job["key"]
+            cached = _cache_get(job["cache_key"], ttl)
+            if cached is not None:
+                job["text"], job["code_obj"] = cached
+                job["cached"] = True
+        use_templates = settings.use_templates and _load_templates() is not None
+        if use_templates:
+            _cache_dir() # Resolve on the main thread; the template index lives there
+        job["args"] = (api_key, settings.model_name, settings.prompt_input, config,
+                       semantic, use_templates)
+        return job
+
+    def _apply(self, context, job):
+        """Runs the generated code on the main thread (bpy is not thread-safe)."""
+        try:
+            if "error" in job:
+                raise job["error"]
+
+            raw_code = _strip_fences(job["text"])
             settings = context.scene.gemini_mcp
-            addon_dir = os.path.dirname(os.path.realpath(__file__))
-            env_path = os.path.join(addon_dir, ".env")
-            load_dotenv(env_path)
-            
-            api_key = os.getenv("GEMINI_API_KEY")
-            
-            # Fallback to manual parsing
-            if not api_key:
-                env_vars = _manual_env_parse(env_path)
-                api_key = env_vars.get("GEMINI_API_KEY")
+            settings.generated_code = raw_code
+            _log_generation(raw_code, settings.debug_logging)
 
-            api_key = api_key or settings.api_key
-            
-            if not api_key:
-                self.report({'ERROR'}, "Missing API Key")
+            if not raw_code:
+                # Empty streams happen on safety blocks; never run or cache them
+                self.report({'WARNING'}, "Gemini did not return any code.")
                 return {'CANCELLED'}
 
-            client = genai.Client(api_key=api_key)
-            full_prompt = (
-                "You are a Blender Python expert. Output ONLY raw executable code. "
-                "No markdown, no conversation. Task: " + settings.prompt_input
-            )
+            # Cache hits carry their code object, so they skip the parser entirely
+            code_obj = job.get("code_obj")
+            if code_obj is None:
+                # Reject malformed output up front instead of half-applying it
+                try:
+                    code_obj = _compile_cached(raw_code)
+                except SyntaxError as e:
+                    self.report({'ERROR'}, f"Invalid code: {e}")
+                    return {'CANCELLED'}
             
-            response = client.models.generate_content(model=settings.model_name, contents=full_prompt)
-            raw_code = response.text.replace("```python", "").replace("```", "").strip()
-            
-            exec(raw_code, globals())
+            _exec_generated(code_obj)
+
+            # Only cache code that actually ran, and only once per shared request.
+            # Template output is cheap to rebuild and specific to its parameters.
+            if ("cache_key" in job and not job.get("cached") and not job.get("template")
+                    and _claim_cache_write(job["shared"])):
+                _cache_put(job["cache_key"], raw_code, code_obj)
+                if job.get("semantic") and "embedding" in job:
+                    _submit(_semantic_store_async(job["model"], job["embedding"], raw_code, code_obj))
             
             # Update Chat History
-            chat = settings.chat_history.add()
-            chat.role = 'user'
-            chat.content = settings.prompt_input
+            _CHAT_HISTORY.append(('user', job["prompt"]))
+            _CHAT_HISTORY.append(('ai', "Executed command: " + job["prompt"]))
             
-            chat = settings.chat_history.add()
-            chat.role = 'ai'
-            chat.content = "Executed command: " + settings.prompt_input
-            
-            self.report({'INFO'}, "Gemini: Script executed successfully.")
+            if job.get("cached"):
+                self.report({'INFO'}, "Gemini: Cached script executed successfully.")
+            elif job.get("template"):
+                self.report({'INFO'}, "Gemini: Template script executed successfully.")
+            else:
+                self.report({'INFO'}, "Gemini: Script executed successfully.")
             
         except Exception as e:
             self.report({'ERROR'}, f"Error: {str(e)}")
             
         return {'FINISHED'}
 
+    def execute(self, context):
+        # Scripted calls have no window to attach a modal handler to, so block
+        job = self._prepare(context)
+        if job is None:
+            return {'CANCELLED'}
+        if job.get("cached"):
+            return self._apply(context, job)
+        out = queue.Queue()
+        job["joined"], job["shared"] = _join_or_start(
+            job["key"], out, lambda: _submit(self._run(job["key"], *job["args"]))
+        )
+        while True:
+            kind, value = out.get()
+            if kind == 'err':
+                job["error"] = value
+            if kind in ('done', 'err'):
+                break
+            self._absorb(job, kind, value)
+        job.setdefault("text", job["fences"].close())
+        return self._apply(context, job)
+
+    def invoke(self, context, event):
+        job = self._prepare(context)
+        if job is None:
+            return {'CANCELLED'}
+        if job.get("cached"):
+            # Cache hit: no request to wait for
+            return self._apply(context, job)
+
+        settings = context.scene.gemini_mcp
+        self._job = job
+        self._queue = queue.Queue()
+        settings.generated_code = ""
+        self._started = time.monotonic()
+        job["joined"], job["shared"] = _join_or_start(
+            job["key"], self._queue, lambda: _submit(self._run(job["key"], *job["args"]))
+        )
+        self._ping = None
+        if settings.connection_status == 'NONE' and not job["joined"]:
+            api_key, model = job["args"][:2]
+            self._ping = _submit(self._ping_model(api_key, model))
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+
+        if job["joined"]:
+            self.report({'INFO'}, "Gemini: Same request already running, sharing its result...")
+        else:
+            self.report({'INFO'}, "Gemini: Generating...")
+        return {'RUNNING_MODAL'}
+
+    def _finish(self, context):
+        """Removes the poll timer and clears the progress readout."""
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._finish(context)
+            _leave(self._job["key"], self._queue)
+            self.report({'WARNING'}, "Gemini: Request cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        settings = context.scene.gemini_mcp
+
+        # Drain everything the worker posted since the last tick
+        job = self._job
+        result = None
+        received = False
+        while result is None:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind in ('done', 'err'):
+                result = (kind, value)
+            else:
+                self._absorb(job, kind, value)
+                received = received or kind == 'delta'
+
+        if received:
+            # Show the partial response in the panel as it streams in
+            settings.generated_code = job["fences"].text
+            if context.area:
+                context.area.tag_redraw()
+
+        if result is None:
+            # The ping only speaks for the connection until the real request answers
+            if self._ping is not None and self._ping.done():
+                failed = self._ping.cancelled() or self._ping.exception() is not None
+                settings.connection_status = 'FAILED' if failed else 'SUCCESS'
+                self._ping = None
+            if job["received"]:
+                chars = job["received"]
+                rate = chars / max(time.monotonic() - self._started, 1e-3)
+                context.workspace.status_text_set(
+                    f"Gemini: received {chars} characters ({rate:.0f} chars/s) - ESC to cancel"
+                )
+            return {'PASS_THROUGH'}
+
+        self._finish(context)
+        kind, value = result
+        # The real request decides the status, whatever an earlier ping said
+        if kind == 'err':
+            job["error"] = value
+            if not isinstance(value, _TruncatedError):
+                settings.connection_status = 'FAILED'
+        else:
+            # Only run the code once the stream has closed
+            job.setdefault("text", job["fences"].close())
+            settings.connection_status = 'SUCCESS'
+        self._ping = None
+        return self._apply(context, job)
+
 class GEMINI_MCP_OT_VoiceRecord(bpy.types.Operator):
     bl_idname = "gemini_mcp.voice_record"
     bl_label = "Voice Command"
     bl_description = "Record a voice command for Gemini"
     
     _timer = None
-    _recording = []
-    _sample_rate = 44100
-    _temp_wav = ""
+    _buf = None
+    _write = 0
+    _sample_rate = 16000 # Plenty for speech recognition
+    _max_seconds = 300
 
     def modal(self, context, event):
         settings = context.scene.gemini_mcp
@@ -253,7 +1300,6 @@ class GEMINI_MCP_OT_VoiceRecord(bpy.types.Operator):
         return {'PASS_THROUGH'}
 
     def execute(self, context):
-        setup_environment()
         settings = context.scene.gemini_mcp
         
         if settings.is_recording:
@@ -262,19 +1308,23 @@ class GEMINI_MCP_OT_VoiceRecord(bpy.types.Operator):
             return {'FINISHED'}
         
         try:
-            import sounddevice as sd
-            import numpy as np
-            import tempfile
+            sd, np, _ = _get_audio_modules()
             
             # Start recording
             settings.is_recording = True
-            self._recording = []
+            # One preallocated buffer (capped at _max_seconds) instead of a copy per callback
+            buf = np.empty((self._sample_rate * self._max_seconds, 1), dtype=np.float32)
+            self._buf = buf
+            self._write = 0
             
             def callback(indata, frames, time, status):
                 if status:
                     print(status)
                 if settings.is_recording:
-                    self._recording.append(indata.copy())
+                    start = self._write
+                    n = min(len(indata), len(buf) - start)
+                    buf[start:start + n] = indata[:n]
+                    self._write = start + n
             
             self.stream = sd.InputStream(samplerate=self._sample_rate, channels=1, callback=callback)
             self.stream.start()
@@ -293,11 +1343,7 @@ class GEMINI_MCP_OT_VoiceRecord(bpy.types.Operator):
             return {'CANCELLED'}
 
     def stop_recording(self, context):
-        import numpy as np
-        import scipy.io.wavfile as wav
-        import tempfile
-        from google import genai
-        from dotenv import load_dotenv
+        _, np, wav = _get_audio_modules()
 
         settings = context.scene.gemini_mcp
         wm = context.window_manager
@@ -306,74 +1352,64 @@ class GEMINI_MCP_OT_VoiceRecord(bpy.types.Operator):
         self.stream.stop()
         self.stream.close()
         
-        if not self._recording:
+        if not self._write:
             self.report({'WARNING'}, "No audio recorded.")
             return {'FINISHED'}
             
         # Process audio
-        audio_data = np.concatenate(self._recording, axis=0)
-        temp_dir = tempfile.gettempdir()
-        self._temp_wav = os.path.join(temp_dir, "gemini_voice_command.wav")
-        wav.write(self._temp_wav, self._sample_rate, audio_data)
+        audio_data = self._buf[:self._write]
+        # 16-bit PCM is half the size of float32 samples on disk and on the wire
+        pcm = np.clip(audio_data * 32767.0, -32768, 32767).astype(np.int16)
+        # Encode in memory; there's no need for a temp file round-trip
+        wav_buf = io.BytesIO()
+        wav.write(wav_buf, self._sample_rate, pcm)
+        audio_bytes = wav_buf.getvalue()
         
         self.report({'INFO'}, "Processing voice command...")
         
         # Call Gemini
         try:
-            addon_dir = os.path.dirname(os.path.realpath(__file__))
-            env_path = os.path.join(addon_dir, ".env")
-            load_dotenv(env_path)
-            
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                env_vars = _manual_env_parse(env_path)
-                api_key = env_vars.get("GEMINI_API_KEY")
-            api_key = api_key or settings.api_key
+            api_key = _resolve_api_key(settings)
             
             if not api_key:
                 self.report({'ERROR'}, "Missing API Key")
                 return {'FINISHED'}
 
-            client = genai.Client(api_key=api_key)
-            
-            # Load audio file
-            with open(self._temp_wav, 'rb') as f:
-                audio_bytes = f.read()
+            client = _get_client(api_key)
 
-            full_prompt = (
-                "You are a Blender Python expert. The user has provided a voice command. "
-                "Output ONLY raw executable code. No markdown, no conversation."
-            )
-            
-            from google.genai import types
-            
             # Use Part.from_bytes for the new google-genai SDK
-            audio_part = types.Part.from_bytes(
+            genai = _get_genai()
+            audio_part = genai.types.Part.from_bytes(
                 data=audio_bytes,
                 mime_type="audio/wav"
             )
 
             response = client.models.generate_content(
                 model=settings.model_name,
-                contents=[
-                    full_prompt,
-                    audio_part
-                ]
+                contents=[audio_part],
+                config=genai.types.GenerateContentConfig(
+                    system_instruction=_VOICE_PREAMBLE,
+                    temperature=settings.temperature,
+                    max_output_tokens=settings.max_tokens,
+                )
             )
             
-            raw_code = response.text.replace("```python", "").replace("```", "").strip()
+            _check_finish(response.candidates)
+            raw_code = _strip_fences(response.text)
+            _log_generation(raw_code, settings.debug_logging)
             
             if raw_code:
-                exec(raw_code, globals())
+                try:
+                    code_obj = _compile_cached(raw_code)
+                except SyntaxError as e:
+                    self.report({'ERROR'}, f"Invalid code: {e}")
+                    return {'CANCELLED'}
+
+                _exec_generated(code_obj)
                 
                 # Update Chat History
-                chat = settings.chat_history.add()
-                chat.role = 'user'
-                chat.content = "[Voice Command]"
-                
-                chat = settings.chat_history.add()
-                chat.role = 'ai'
-                chat.content = "Executed voice command."
+                _CHAT_HISTORY.append(('user', "[Voice Command]"))
+                _CHAT_HISTORY.append(('ai', "Executed voice command."))
                 
                 self.report({'INFO'}, "Gemini: Voice command executed.")
             else:
@@ -381,13 +1417,60 @@ class GEMINI_MCP_OT_VoiceRecord(bpy.types.Operator):
                 
         except Exception as e:
             self.report({'ERROR'}, f"Processing failed: {str(e)}")
-        finally:
-            if os.path.exists(self._temp_wav):
-                os.remove(self._temp_wav)
                 
         return {'FINISHED'}
 
 # --- UI PANEL ---
+
+def _draw_history(layout):
+    """Last few chat lines."""
+    count = len(_CHAT_HISTORY)
+    if count == 0:
+        return
+    box = layout.box()
+    for i in range(max(0, count - 5), count): # Show last 5
+        role, content = _CHAT_HISTORY[i]
+        row = box.row()
+        if role == 'user':
+            row.label(text="YOU:", icon='USER')
+        else:
+            row.label(text="AI:", icon='BLENDER')
+        row.label(text=content)
+
+def _draw_config(layout, settings):
+    """API key, model and cache options."""
+    box = layout.box()
+    if _API_KEY:
+        # Snapshot from register()/Reload .env, so no environment lookup per redraw
+        box.label(text="API Key: set in environment / .env", icon='CHECKMARK')
+    else:
+        box.prop(settings, "api_key", text="API Key")
+    box.prop(settings, "model_name", text="Model")
+    row = box.row(align=True)
+    row.prop(settings, "temperature")
+    row.prop(settings, "max_tokens")
+    box.operator("gemini_mcp.reload_env", icon='FILE_REFRESH')
+    box.prop(settings, "use_templates")
+    row = box.row(align=True)
+    row.prop(settings, "use_cache")
+    row.operator("gemini_mcp.clear_cache", icon='TRASH', text="")
+    if settings.use_cache:
+        box.prop(settings, "cache_ttl_hours")
+        row = box.row(align=True)
+        row.prop(settings, "use_semantic_cache")
+        sub = row.row()
+        sub.active = settings.use_semantic_cache
+        sub.prop(settings, "similarity_threshold")
+
+def _draw_generated(layout, settings, code):
+    """Tail of the latest generated code (fills in live while a request streams)."""
+    box = layout.box()
+    for line in code.splitlines()[-8:]: # Show last 8 lines
+        box.label(text=line)
+    row = box.row(align=True)
+    row.prop(settings, "debug_logging")
+    row.operator("gemini_mcp.copy_last_code", icon='COPYDOWN', text="")
+
 class GEMINI_MCP_PT_Panel(bpy.types.Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
@@ -396,9 +1479,6 @@ class GEMINI_MCP_PT_Panel(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
-        if not hasattr(context.scene, "gemini_mcp"):
-            return
-            
         settings = context.scene.gemini_mcp
         
         # Dependency check
@@ -408,26 +1488,15 @@ class GEMINI_MCP_PT_Panel(bpy.types.Panel):
             layout.label(text="Dependencies missing (google-genai, sounddevice, etc.)")
             return
 
-        # Chat History Display
-        if len(settings.chat_history) > 0:
-            box = layout.box()
-            for msg in settings.chat_history[-5:]: # Show last 5
-                row = box.row()
-                if msg.role == 'user':
-                    row.label(text="YOU:", icon='USER')
-                else:
-                    row.label(text="AI:", icon='BLENDER')
-                row.label(text=msg.content)
-        
+        _draw_history(layout)
         layout.separator()
-        
-        # Config Box
-        box = layout.box()
-        box.prop(settings, "api_key", text="API Key")
-        box.prop(settings, "model_name", text="Model")
+        _draw_config(layout, settings)
         
         # Prompt Area
         layout.prop(settings, "prompt_input", text="")
+        code = settings.generated_code
+        if code:
+            _draw_generated(layout, settings, code)
         
         # Voice & Execute Buttons
         row = layout.row(align=True)
@@ -441,26 +1510,35 @@ class GEMINI_MCP_PT_Panel(bpy.types.Panel):
 
 # --- REGISTRATION ---
 classes = (
-    GEMINI_MCP_ChatLine,
     GEMINI_MCP_Settings,
     GEMINI_MCP_OT_InstallDeps,
+    GEMINI_MCP_OT_ReloadEnv,
+    GEMINI_MCP_OT_ClearCache,
+    GEMINI_MCP_OT_CopyLastCode,
     GEMINI_MCP_OT_TestConnection,
     GEMINI_MCP_OT_Execute,
     GEMINI_MCP_OT_VoiceRecord,
     GEMINI_MCP_PT_Panel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
     # Setup environment on registration (adds paths)
     setup_environment()
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _start_log()
+    _submit(_prewarm())
+    _register_classes()
     bpy.types.Scene.gemini_mcp = bpy.props.PointerProperty(type=GEMINI_MCP_Settings)
 
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.gemini_mcp
+    _reset_client()
+    _cancel_inflight()
+    _stop_loop()
+    _stop_log()
+    _unregister_classes()
+    if hasattr(bpy.types.Scene, "gemini_mcp"):
+        del bpy.types.Scene.gemini_mcp
 
 if __name__ == "__main__":
     register()